@@ -12,7 +12,7 @@ setuptools.setup(
     author_email="nwtbekele@gmail.com",
     python_requires=(">=3.11.0"),
     install_requires=[
-        "tomlkit==0.13.0",
+        "packaging>=22",
     ],
     license="Apache 2.0",
     description=description,
@@ -1,21 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Package:
     """Used to store a package's information including name, license, and packages it requires."""
 
     name: str  # name of the package
     license: str  # license of the package
+    requirements: list[str] = field(default_factory=list)  # packages it requires
+    direct: bool = False  # whether the project depends on it directly
 
     def __str__(self) -> str:
         return f"{self.name} ({self.license})"
-
-    @property
-    def requirements(self) -> list[str]:
-        """Returns the list of packages the package requires."""
-        return self._requirements
-
-    @requirements.setter
-    def requirements(self, reqs: list[str]) -> None:
-        self._requirements = reqs
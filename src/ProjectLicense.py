@@ -1,12 +1,186 @@
-import platform
-import re
-import subprocess
-from collections import Counter
-from importlib.metadata import distribution
+import functools
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import Distribution, PackageMetadata, distributions
+from pathlib import Path
+from typing import Any
+
+from packaging.requirements import InvalidRequirement, Requirement
 
 from .Package import Package
 from .pretty_string import *
 
+# packages `pip freeze` leaves out of its output by default
+_FREEZE_EXCLUDES = {"pip", "setuptools", "wheel", "distribute"}
+
+_LICENSE_PREFIX = "License :: "  # start of every license trove classifier
+
+# bumped whenever the way licenses or requirements are read changes, so stale caches are dropped
+_CACHE_VERSION = 6
+
+# fields of every cache entry
+_CACHE_FIELDS = {"mtime", "python", "name", "license", "requirements"}
+
+
+@functools.lru_cache(maxsize=None)
+def _applicable_requirement(req: str) -> str | None:
+    """Parse a requirement and evaluate its environment marker. Cached since the same
+    requirement strings show up in many packages' metadata.
+
+    Args:
+        req: The requirement. Formatted '<package_name> <specifier> ; <marker>'
+
+    Returns the name of the required package or None if the requirement is invalid or its
+        marker (python version, platform, extra, ...) does not apply to this environment, in
+        which case the requirement is not installed.
+    """
+
+    try:
+        requirement = Requirement(req)
+    except InvalidRequirement:
+        return None
+
+    if requirement.marker is None or requirement.marker.evaluate():
+        return requirement.name
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_license(license: str | None, classifier: tuple[str, ...]) -> str:
+    """Clean up a package's license, falling back to its license classifier. Cached since most
+    packages share a handful of License and Classifier metadata values.
+
+    Args:
+        license: The package's License metadata.
+        classifier: The package's Classifier metadata. Empty if the License metadata is usable
+            on its own.
+
+    Returns the packages license.
+    """
+
+    if not license or len(license) > 10:
+        if not classifier:
+            # edge case when package_name does not have classifier information
+            return "?"
+
+        license = next(
+            (
+                value.rpartition(" :: ")[2]
+                for value in classifier
+                if value.startswith(_LICENSE_PREFIX)
+            ),
+            license,
+        )
+
+    return license.replace("License", "").strip() if license else "?"
+
+
+def _normalize(name: str) -> str:
+    """Normalize a package name so differently spelled references to the same distribution
+    (`Foo.Bar`, `foo-bar`, `foo_bar`) compare equal.
+
+    Args:
+        name: The package's name.
+
+    Returns the normalized name.
+    """
+
+    value = name.lower().replace("-", "_").replace(".", "_")
+    while "__" in value:
+        value = value.replace("__", "_")
+    return value
+
+
+def _cache_file() -> Path:
+    """Returns the path of the file the licenses and requirements are cached in across runs.
+    Every python environment gets its own file, so stale entries can be pruned without
+    evicting the other environments' entries.
+    """
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    environment = hashlib.sha256(sys.prefix.encode()).hexdigest()[:16]
+    return Path(cache_home) / "licensepy" / f"index-{environment}.json"
+
+
+def _dist_path(dist: Distribution) -> str | None:
+    """Get the path of a distribution's metadata directory.
+
+    Args:
+        dist: The installed distribution.
+
+    Returns the path of the distribution's .dist-info/.egg-info directory or None if the
+        distribution is not stored on the file system.
+    """
+
+    # `_path` is private, but deliberately used: it is set by every `PathDistribution` (all
+    # distributions found on sys.path) and there is no public attribute for the metadata
+    # directory (`locate_file("")` gives the site-packages directory instead)
+    path = getattr(dist, "_path", None)
+    return str(path) if path else None
+
+
+def _index_key(dist: Distribution) -> str | None:
+    """Get the normalized name a distribution is indexed under without parsing its metadata.
+
+    Args:
+        dist: The installed distribution.
+
+    Returns the distribution's normalized name or None if its metadata has no name.
+    """
+
+    try:
+        # `_normalized_name` is private, but deliberately used: `PathDistribution` reads it from
+        # the metadata directory's name (`<name>-<version>.dist-info`), only falling back to
+        # parsing the METADATA file when the directory is not named that way
+        name = dist._normalized_name
+    except TypeError:
+        # no Name in the metadata
+        return None
+    return _normalize(name) if name else None
+
+
+def _cache_key(dist: Distribution) -> tuple[str, float] | None:
+    """Get the key of a distribution in the cache. Installing, upgrading, or removing a package
+    rewrites its metadata directory, changing its modification time.
+
+    Args:
+        dist: The installed distribution.
+
+    Returns the path and modification time of the distribution's metadata directory or None if
+        the distribution is not stored on the file system.
+    """
+
+    if not (path := _dist_path(dist)):
+        return None
+    try:
+        return path, os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _is_editable(dist: Distribution) -> bool:
+    """Check if a distribution was installed in editable mode (`pip install -e`).
+
+    Args:
+        dist: The installed distribution.
+
+    Returns whether the distribution's direct_url.json marks it as editable.
+    """
+
+    if not (direct_url := dist.read_text("direct_url.json")):
+        return False
+    try:
+        dir_info = json.loads(direct_url).get("dir_info")
+    except (ValueError, AttributeError):
+        # malformed direct_url.json (not JSON or not a JSON object)
+        return False
+    return isinstance(dir_info, dict) and dir_info.get("editable") is True
+
 
 class ProjectLicenses:
     """Used to store project's dependencies and licenses of said dependencies."""
@@ -17,6 +191,9 @@ class ProjectLicenses:
         by_package: bool,
         print_fails: bool,
         to_avoid: list[str] | None,
+        dependencies: list[str] | None = None,
+        use_cache: bool = False,
+        jobs: int | None = None,
     ) -> None:
         self._recursive: bool = (
             recursive  # cli argument for recursive dependencies fetchign
@@ -25,70 +202,215 @@ class ProjectLicenses:
         self.print_fails = (
             print_fails  # print only packages whose licenses want to be avoided
         )
-        self.to_avoid = to_avoid if to_avoid else []  # list of licenses to avoid
+        self.to_avoid: frozenset[str] = frozenset(to_avoid) if to_avoid else frozenset()
+        # licenses to avoid
+        self._declared_dependencies = dependencies
+        # requirements declared in pyproject.toml (None when not declared)
+
+        self._jobs = jobs  # threads reading metadata (None for ThreadPoolExecutor's default)
 
-        self._python_version: tuple[str, str, str] = platform.python_version_tuple()
+        self._python_version: list[int] = list(sys.version_info[:3])
+        # (major, minor, micro) stored as a list since it is compared to the JSON cache entries
         self._packages: dict[str, Package] = {}  # map package name to object
-        self._project_dependencies: list[str] = []
-        # direct dependencies names of project
+
+        self._dist_index: dict[str, Distribution] = {}
+        # map normalized package name to its installed distribution (built with a single
+        # sys.path scan instead of one scan per `distribution(name)` lookup)
+        for dist in distributions():
+            # first match wins, same as `distribution(name)`
+            if (key := _index_key(dist)) and key not in self._dist_index:
+                self._dist_index[key] = dist
+
+        self._dist_names: dict[str, str] = {}
+        # map normalized package name to the name in its metadata, filled in as the packages are
+        # built since reading it means parsing the METADATA file
+
+        self._missing_names: dict[str, str] = {}
+        # map normalized name of a requirement that is not installed to its first spelling
+
+        self._use_cache = use_cache  # reuse licenses and requirements from previous runs
+        self._cache: dict[str, dict[str, Any]] = self._load_cache() if use_cache else {}
+        # map metadata directory to its modification time, license, and requirements
+        self._cache_updated = False
+
+    def _load_cache(self) -> dict[str, dict[str, Any]]:
+        """Load the licenses and requirements cached by previous runs.
+
+        Returns the cache or an empty cache if it is missing, unreadable, or outdated.
+        """
+
+        try:
+            cache = json.loads(_cache_file().read_text())
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(cache, dict) or cache.get("version") != _CACHE_VERSION:
+            return {}
+
+        packages = cache.get("packages")
+        if not isinstance(packages, dict) or not all(
+            isinstance(entry, dict) and _CACHE_FIELDS <= entry.keys()
+            for entry in packages.values()
+        ):
+            # malformed cache file
+            return {}
+        return packages
+
+    def save_cache(self) -> None:
+        """Write the licenses and requirements found in this run to the cache file, dropping
+        the entries of packages that are no longer installed. The file is replaced atomically so
+        concurrent runs never read a partially written cache.
+        """
+
+        if not self._use_cache:
+            return
+
+        installed = {_dist_path(dist) for dist in self._dist_index.values()}
+        for path in self._cache.keys() - installed:
+            del self._cache[path]
+            self._cache_updated = True
+
+        if not self._cache_updated:
+            return
+
+        cache_file = _cache_file()
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as tmp_file:
+                    json.dump(
+                        {"version": _CACHE_VERSION, "packages": self._cache}, tmp_file
+                    )
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # caching is an optimization so an unwritable cache directory is not an error
+            pass
+
+    def _get_dist(self, package_name: str) -> Distribution | None:
+        """Get the installed distribution of a package from the index.
+
+        Args:
+            package_name: The package's name.
+
+        Returns the package's distribution or None if it is not installed.
+        """
+
+        return self._dist_index.get(_normalize(package_name))
+
+    def _get_metadata(self, package_name: str) -> PackageMetadata | None:
+        """Get the metadata of a package. Every call parses its METADATA file again.
+
+        Args:
+            package_name: The package's name.
+
+        Returns the package's metadata or None if it is not installed.
+        """
+
+        return dist.metadata if (dist := self._get_dist(package_name)) else None
+
+    def _canonical_name(self, package_name: str) -> str:
+        """Get the one spelling used for a package (the name in its metadata when installed, the
+        first spelling seen otherwise) so a package required as `foo-bar` and `foo_bar` is only
+        fetched and reported once. Called from the main thread only.
+
+        Args:
+            package_name: The package's name as spelled by a requirement.
+
+        Returns the package's canonical name.
+        """
+
+        key = _normalize(package_name)
+        if key in self._dist_names:
+            return self._dist_names[key]
+        if dist := self._dist_index.get(key):
+            # installed package that was not built (not fetching recursively)
+            name = self._dist_names[key] = dist.metadata["Name"] or package_name
+            return name
+        return self._missing_names.setdefault(key, package_name)
 
     def find_project_dependencies(self) -> list[str]:
         """Get all the direct dependencies of the project.
 
+        If the project declares its dependencies in pyproject.toml, those whose environment
+        markers apply are returned, including the ones that are not installed (reported with an
+        unknown license). Otherwise, the installed distributions are read in-process with
+        `importlib.metadata`, skipping the same packages as `pip freeze --exclude-editable`.
+
         Returns a list of the names of the packages the project depends on.
         """
 
-        dependencies = subprocess.check_output(
-            ["python", "-m" "pip", "freeze", "--exclude-editable"], text=True
-        )
-        dependencies = [
-            re.split(r"==|@", dep)[0].strip() for dep in dependencies.split("\n") if dep
+        if self._declared_dependencies is not None:
+            # declared dependencies without duplicates, keeping the first spelling
+            declared: dict[str, str] = {}
+            for req in self._declared_dependencies:
+                if dep := _applicable_requirement(req):
+                    declared.setdefault(_normalize(dep), dep)
+            return list(declared.values())
+
+        candidates = [key for key in self._dist_index if key not in _FREEZE_EXCLUDES]
+        with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+            # reads every candidate's direct_url.json concurrently
+            editable = executor.map(
+                _is_editable, (self._dist_index[key] for key in candidates)
+            )
+            return [
+                key for key, is_editable in zip(candidates, editable) if not is_editable
+            ]
+
+    def _read_requirements(self, metadata: PackageMetadata) -> list[str]:
+        """Get the packages that a package requires from its metadata.
+
+        Args:
+            metadata: The package's parsed metadata.
+
+        Returns a list of the packages requirements, spelled as in the metadata. These do not
+            depend on which other packages are installed so they can be cached.
+        """
+
+        return [
+            name
+            for req in metadata.get_all("Requires-Dist") or ()
+            if (name := _applicable_requirement(req))
         ]
-        return dependencies
 
-    def _matches_python_version(self, req_info: str) -> bool:
-        """Check if the python version for which requirement of a package is needed matches the
-        projects python version. `distribution` does not have metadata for packages that are not
-        install and package requirements with specified python version for the requirement are not
-        installed if the version is not matched.
+    def _read_license(self, metadata: PackageMetadata) -> str:
+        """Get the license of a package from its License metadata or Classifier metadata.
 
         Args:
-            req_info: The package requirement info.
-                Formatted '<package_name> <expression> <version> ; python_version <expression> <python_version>
+            metadata: The package's parsed metadata.
 
-        Returns whether the projects version matches the packages specified version.
+        Returns the packages license.
         """
 
-        expression = req_info.split(";")[1]
+        if (license := metadata.get("License")) and len(license) <= 10:
+            return _resolve_license(license, ())
 
-        for char in ["'", '"', " "]:
-            expression = expression.replace(char, "")
+        # really long license strings are likely to be the entire licensing doc
+        return _resolve_license(license, tuple(metadata.get_all("Classifier") or ()))
 
-        version = re.search(r"python_version(==|<=|>=|!=|<|>)\d\.\d(\.\d)?", expression)
-        assert version
-        version = version.group(0)
-        version = re.split(r"(==|<=|>=|!=|<|>)", version)[2].strip().split(".")
+    def _extract(self, package_name: str) -> tuple[str, str, list[str]]:
+        """Get the name, license, and requirements of a package, parsing its METADATA file only
+        once.
 
-        if len(version) == 2:
-            version.append(self._python_version[2])
+        Args:
+            package_name: The package's name.
 
-        diff = [
-            int(ver) - int(p_ver) for ver, p_ver in zip(version, self._python_version)
-        ]
+        Returns the package's name in its metadata, license, and list of requirements.
+        """
 
-        if "<=" in expression:
-            return diff[0] > 0 or (diff[0] == 0 and diff[1] >= 0)
-        elif "<" in expression:
-            return diff[0] > 0 or (diff[0] == 0 and diff[1] > 0)
-        elif ">=" in expression:
-            return diff[0] < 0 or (diff[0] == 0 and diff[1] <= 0)
-        elif ">" in expression:
-            return diff[0] < 0 or (diff[0] == 0 and diff[1] > 0)
-        elif "==" in expression:
-            return diff[0] == 0 and diff[1] == 0 and diff[2] == 0
-        elif "!=" in expression:
-            return diff[0] != 0 or diff[1] != 0 or diff[2] != 0
-        return True
+        if not (metadata := self._get_metadata(package_name)):
+            # requirement that is not installed
+            return package_name, "?", []
+
+        return (
+            metadata["Name"] or package_name,
+            self._read_license(metadata),
+            self._read_requirements(metadata),
+        )
 
     def get_package_requirements(self, package_name: str) -> list[str]:
         """Get the packages that a package requires.
@@ -99,18 +421,15 @@ class ProjectLicenses:
         Returns a list of the packages requirements.
         """
 
-        package_requirements = []
-        if req_info := distribution(package_name).metadata.get_all("Requires-Dist"):
-            for req in req_info:
-                if (
-                    ";" not in req
-                    or ("; python_version" in req)
-                    and self._matches_python_version(req)
-                ):
-                    package_req = re.split(r"[<>=~\(;!]", req)[0].strip()
-                    package_requirements.append(package_req)
+        if not (metadata := self._get_metadata(package_name)):
+            # requirement that is not installed
+            return []
 
-        return package_requirements
+        return list(
+            dict.fromkeys(
+                self._canonical_name(req) for req in self._read_requirements(metadata)
+            )
+        )
 
     def get_license(self, package_name: str) -> str:
         """Get the license of the package from the cache, License metadata, or Classifier metadata.
@@ -124,49 +443,137 @@ class ProjectLicenses:
         if package_name in self._packages:
             return self._packages[package_name].license
 
+        if not (metadata := self._get_metadata(package_name)):
+            return "?"
+
+        return self._read_license(metadata)
+
+    def _build_package(
+        self, package_name: str
+    ) -> tuple[Package, tuple[str, float] | None]:
+        """Create a package with its name, license, and requirements, reusing the cached ones if
+        the package's metadata did not change since they were cached so its METADATA file is
+        only parsed on cache misses. Only reads metadata and the cache so it is safe to run in
+        the worker threads.
+
+        Args:
+            package_name: The package's name.
+
+        Returns the package and its cache key (None when not caching or not cacheable).
+        """
+
+        key = None
+        if self._use_cache and (dist := self._get_dist(package_name)):
+            key = _cache_key(dist)
+
         if (
-            not (license := distribution(package_name).metadata.get("License"))
-            or len(license) > 10
+            key
+            and (entry := self._cache.get(key[0]))
+            and entry.get("mtime") == key[1]
+            and entry.get("python") == self._python_version
         ):
-            # really long license strings are likely to be the entire licensing doc
+            package = Package(entry["name"], entry["license"], entry["requirements"])
+            return package, key
+
+        return Package(*self._extract(package_name)), key
+
+    def _add_package(
+        self, package_name: str, package: Package, key: tuple[str, float] | None
+    ) -> None:
+        """Store a package, record its canonical name, and update its cache entry. Called from
+        the main thread only.
+
+        Args:
+            package_name: The name the package was built from.
+            package: The package to store, with its requirements spelled as in its metadata.
+            key: The package's cache key from `_build_package`.
+        """
+
+        self._packages[package.name] = package
+        if _normalize(package_name) in self._dist_index:
+            self._dist_names[_normalize(package_name)] = package.name
+        else:
+            self._missing_names.setdefault(_normalize(package_name), package.name)
+
+        if key:
+            path, mtime = key
+            entry = {
+                "mtime": mtime,
+                "python": self._python_version,
+                "name": package.name,
+                "license": package.license,
+                "requirements": package.requirements,
+            }
+            if self._cache.get(path) != entry:
+                self._cache[path] = entry
+                self._cache_updated = True
+
+    def _canonicalize_requirements(self, package: Package) -> None:
+        """Give a package's requirements their canonical names, without duplicates. Done once
+        the requirements are built since the names depend on the other installed packages.
+
+        Args:
+            package: The package whose requirements are spelled as in its metadata.
+        """
+
+        package.requirements = list(
+            dict.fromkeys(self._canonical_name(req) for req in package.requirements)
+        )
 
-            classifier = distribution(package_name).metadata.get_all("Classifier")
-            if not classifier:
-                # edge case when package_name does not have classifier information
-                return "?"
+    def _resolve_packages(
+        self,
+        executor: ThreadPoolExecutor,
+        package_names: list[str],
+        direct: bool = False,
+    ) -> list[Package]:
+        """Build packages and store them. Reading metadata is I/O bound so the packages are
+        built concurrently, but they are stored on this thread.
 
-            for value in classifier:
-                if "License" in value:
-                    license = value.split(" :: ")[-1]
-                    return license.replace("License", "").strip()
+        Args:
+            executor: The thread pool the packages are built in.
+            package_names: The names of the packages.
+            direct: Whether the project depends on the packages directly.
 
-        return license.replace("License", "").strip() if license else "?"
+        Returns the built packages.
+        """
+
+        packages = []
+        built = executor.map(self._build_package, package_names)
+        for package_name, (package, key) in zip(package_names, built):
+            package.direct = direct
+            self._add_package(package_name, package, key)
+            packages.append(package)
+        return packages
 
     def get_project_dependencies_and_licenses(self) -> None:
         """Get the direct dependencies of the project and their licenses."""
 
         dependencies = self.find_project_dependencies()
-        for package in dependencies:
-            cur_package = Package(package, self.get_license(package))
-            self._packages[package] = cur_package
-            cur_package.requirements = self.get_package_requirements(package)
-            self._project_dependencies.append(package)
+        with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+            self._resolve_packages(executor, dependencies, direct=True)
 
     def fetch_recursive_dependencies(self):
         """Recursively find all the packages each of the direct dependencies of the project require."""
 
-        queue = self._project_dependencies[:]
-        while queue:
-            package = queue.pop()
-
-            if package not in self._packages:
-                cur_package = Package(package, self.get_license(package))
-                cur_package.requirements = self.get_package_requirements(package)
-                self._packages[package] = cur_package
-
-            for req in self._packages[package].requirements:
-                if req not in self._packages:
-                    queue.append(req)
+        # breadth first traversal where each package is enqueued exactly once, so shared
+        # dependencies are not fetched again for every package that requires them. Every layer
+        # of the traversal is built concurrently.
+        seen = {_normalize(name) for name in self._packages}
+        layer = [package for package in self._packages.values() if package.direct]
+        with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+            while layer:
+                requirements = []
+                for package in layer:
+                    for req in package.requirements:
+                        if (key := _normalize(req)) not in seen:
+                            seen.add(key)
+                            requirements.append(req)
+
+                next_layer = self._resolve_packages(executor, requirements)
+                # every requirement of this layer is built now so their names are known
+                for package in layer:
+                    self._canonicalize_requirements(package)
+                layer = next_layer
 
     def _requirements_to_str(self, requirements: list[str]) -> str:
         """Generate the string representation of the requirements for a package. Colors them
@@ -192,57 +599,39 @@ class ProjectLicenses:
     def pretty_print(self):
         """Pretty print the licenses of all the dependencies of the project."""
 
-        packages = (
-            sorted(list(self._packages.values()), key=lambda x: x.license)
-            if not self.by_package
-            else sorted(self._packages.values(), key=lambda x: x.name.lower())
-        )
-        license_count = Counter([package.license for package in packages])
-
-        last_license = None
-        print_license = False
-        for pack in packages:
-            pack_text = ""
-            if self.by_package:
-                mark = (
-                    success("\N{check mark}")
-                    if pack.license not in self.to_avoid
-                    else failure("x")
-                )
-
-                print_license = (
-                    self.print_fails and pack.license in self.to_avoid
-                ) or not self.print_fails
-                if print_license:
-                    pack_text += f"{mark}  {pack}"
-            else:
-                if last_license != pack.license:
-                    # u'/u2713'
-                    mark = (
-                        success("\N{check mark}")
-                        if pack.license not in self.to_avoid
-                        else failure("x")
-                    )
-
-                    print_license = (
-                        self.print_fails and pack.license in self.to_avoid
-                    ) or not self.print_fails
-                    if print_license:
-                        pack_text += f"\n---{pack.license} [{license_count[pack.license]}]---  {mark}\n"
-
-                last_license = pack.license
-
-                if (
-                    self.print_fails and pack.license in self.to_avoid
-                ) or not self.print_fails:
-                    pack_text += f"\t{pack.name}"
-
-            if self._recursive and pack.requirements and print_license:
-                pack_text += self._requirements_to_str(pack.requirements)
-
-            if print_license:
-                print(pack_text)
-        print()
+        lines = []  # written to stdout at once instead of a print per package
+        passed, failed = success("\N{check mark}"), failure("x")  # styled once for all lines
+        if self.by_package:
+            for pack in sorted(self._packages.values(), key=lambda x: x.name.lower()):
+                if self.print_fails and pack.license not in self.to_avoid:
+                    continue
+
+                mark = failed if pack.license in self.to_avoid else passed
+                pack_text = f"{mark}  {pack}"
+                if self._recursive and pack.requirements:
+                    pack_text += self._requirements_to_str(pack.requirements)
+                lines.append(pack_text)
+        else:
+            # group the packages by license in one pass instead of sorting all of them
+            groups: defaultdict[str, list[Package]] = defaultdict(list)
+            for pack in self._packages.values():
+                groups[pack.license].append(pack)
+
+            for license in sorted(groups):
+                if self.print_fails and license not in self.to_avoid:
+                    continue
+
+                packs = groups[license]
+                mark = failed if license in self.to_avoid else passed
+                lines.append(f"\n---{license} [{len(packs)}]---  {mark}")
+                for pack in packs:
+                    pack_text = f"\t{pack.name}"
+                    if self._recursive and pack.requirements:
+                        pack_text += self._requirements_to_str(pack.requirements)
+                    lines.append(pack_text)
+
+        sys.stdout.write("\n".join(lines) + "\n\n" if lines else "\n")
+        sys.stdout.flush()
 
     def check_for_bad_license(self) -> int:
         """Tests if any of the user provided licences to avoid where found used by dependencies.
@@ -251,10 +640,9 @@ class ProjectLicenses:
             dependencies and 1 otherwise)
         """
 
-        unique_licenses = set(package.license for package in self._packages.values())
-
-        for license in self.to_avoid:
-            if license in unique_licenses:
-                return 1
-
-        return 0
+        # isdisjoint consumes the generator lazily so it stops at the first license to avoid
+        return int(
+            not self.to_avoid.isdisjoint(
+                package.license for package in self._packages.values()
+            )
+        )
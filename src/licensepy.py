@@ -1,13 +1,10 @@
 #!/usr/bin/env python3
 
 import argparse
+import os
 from pathlib import Path
 from typing import Any
 
-import tomlkit
-
-from .ProjectLicense import ProjectLicenses
-
 # conda search --info numpy==1.26.4=py312hc5e2394_0
 # c conda-forge
 # conda list numpy to get the infor
@@ -16,18 +13,6 @@ from .ProjectLicense import ProjectLicenses
 def run_licensepy():
     """Run the licensepy algorithm."""
 
-    to_avoid = None
-    if Path("pyproject.toml").is_file():
-        data: dict[str, Any] = tomlkit.parse(Path("pyproject.toml").read_text())
-        if "licensepy" in data and "avoid" in data["licensepy"]:
-            to_avoid = data["licensepy"]["avoid"]
-            assert isinstance(
-                to_avoid, list
-            ), f"Expected avoid to have type list[str]. Found {type(to_avoid)}"
-            assert all(
-                isinstance(item, str) for item in to_avoid
-            ), "All items of the list should be strings."
-
     parser = argparse.ArgumentParser()
     parser.add_argument(
         "--recursive",
@@ -56,26 +41,73 @@ def run_licensepy():
         default=False,
         help="Only print the packages whose licenses are flagged to be avoided.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Don't reuse or save the licenses and requirements cached by previous runs.",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=min(32, (os.cpu_count() or 1) * 4),
+        help="Number of threads used to read the packages' metadata.",
+    )
 
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+
+    to_avoid = None
+    dependencies = None
+    if Path("pyproject.toml").is_file():
+        import tomllib
+
+        with open("pyproject.toml", "rb") as pyproject:
+            data: dict[str, Any] = tomllib.load(pyproject)
+        if "project" in data and "dependencies" in data["project"]:
+            dependencies = data["project"]["dependencies"]
+            assert isinstance(
+                dependencies, list
+            ), f"Expected dependencies to have type list[str]. Found {type(dependencies)}"
+            assert all(
+                isinstance(item, str) for item in dependencies
+            ), "All items of the dependencies list should be strings."
+        if "licensepy" in data and "avoid" in data["licensepy"]:
+            to_avoid = data["licensepy"]["avoid"]
+            assert isinstance(
+                to_avoid, list
+            ), f"Expected avoid to have type list[str]. Found {type(to_avoid)}"
+            assert all(
+                isinstance(item, str) for item in to_avoid
+            ), "All items of the list should be strings."
+
+    # imported after parsing the arguments so `--help` and argument errors don't pay for
+    # importing importlib.metadata, packaging, and concurrent.futures
+    from .ProjectLicense import ProjectLicenses
 
     project = ProjectLicenses(
-        args.recursive, args.by_package, args.print_fails, to_avoid
+        args.recursive,
+        args.by_package,
+        args.print_fails,
+        to_avoid,
+        dependencies,
+        use_cache=not args.no_cache,
+        jobs=args.jobs,
     )
     project.get_project_dependencies_and_licenses()
 
     if args.recursive:
         project.fetch_recursive_dependencies()
 
+    project.save_cache()
+
     if not args.silent:
         project.pretty_print()
 
     return project.check_for_bad_license()
 
 
-# color code the licenses
-# pyproject finding
-# testing
-
 if __name__ == "__main__":
     exit(run_licensepy())
@@ -0,0 +1,179 @@
+import json
+import os
+import shutil
+import sys
+from importlib.metadata import distributions
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from . import ProjectLicense
+from .ProjectLicense import ProjectLicenses
+
+
+@pytest.fixture
+def site(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Fake site-packages directory that is the only place distributions are found in, with
+    the cache stored under the test's temporary directory."""
+
+    site = tmp_path / "site-packages"
+    site.mkdir()
+    monkeypatch.setattr(
+        ProjectLicense, "distributions", lambda: distributions(path=[str(site)])
+    )
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return site
+
+
+def install(
+    site: Path, name: str, license: str, requires: tuple[str, ...] = ()
+) -> Path:
+    """Create the dist-info directory of a package in the fake site-packages directory."""
+
+    dist_info = site / f"{name}-1.0.dist-info"
+    dist_info.mkdir()
+    metadata = ["Metadata-Version: 2.1", f"Name: {name}", "Version: 1.0"]
+    metadata.append(f"License: {license}")
+    metadata.extend(f"Requires-Dist: {req}" for req in requires)
+    (dist_info / "METADATA").write_text("\n".join(metadata) + "\n")
+    return dist_info
+
+
+def run(
+    use_cache: bool = True, dependencies: list[str] | None = None
+) -> ProjectLicenses:
+    """Find the recursive dependencies and their licenses like `licensepy -r`."""
+
+    project = ProjectLicenses(
+        True, False, False, None, dependencies, use_cache=use_cache
+    )
+    project.get_project_dependencies_and_licenses()
+    project.fetch_recursive_dependencies()
+    project.save_cache()
+    return project
+
+
+def test_requirement_spellings_are_merged_when_not_installed(site: Path) -> None:
+    install(site, "a", "MIT", ("foo-bar",))
+    install(site, "b", "MIT", ("foo_bar",))
+
+    project = run(use_cache=False)
+
+    # the first spelling seen is kept, which depends on the directory listing order
+    missing = [name for name in project._packages if name not in ("a", "b")]
+    assert missing in (["foo-bar"], ["foo_bar"])
+    assert project._packages[missing[0]].license == "?"
+    assert project._packages["a"].requirements == missing
+    assert project._packages["b"].requirements == missing
+
+
+def test_cached_requirements_follow_newly_installed_packages(site: Path) -> None:
+    install(site, "a", "MIT", ("foo-bar",))
+    install(site, "b", "MIT", ("foo_bar",))
+    run()
+
+    install(site, "Foo_Bar", "GPL")
+    project = run()
+
+    assert sorted(project._packages) == ["Foo_Bar", "a", "b"]
+    assert project._packages["Foo_Bar"].license == "GPL"
+    assert project._packages["a"].requirements == ["Foo_Bar"]
+    assert project._packages["b"].requirements == ["Foo_Bar"]
+
+
+def test_declared_dependencies_are_all_reported(site: Path) -> None:
+    install(site, "setuptools", "MIT")
+    install(site, "a", "MIT")
+    install(site, "b", "MIT")
+
+    project = run(
+        use_cache=False,
+        dependencies=["setuptools>=60", "a", "missing-pkg", "b; python_version < '3'"],
+    )
+
+    # pip freeze's exclusions don't apply to declared dependencies and the ones that are not
+    # installed are reported with an unknown license
+    assert sorted(project._packages) == ["a", "missing-pkg", "setuptools"]
+    assert project._packages["missing-pkg"].license == "?"
+    assert all(package.direct for package in project._packages.values())
+
+
+def set_license(dist_info: Path, license: str) -> None:
+    """Change a package's license in place, which keeps its dist-info directory's mtime."""
+
+    metadata = dist_info / "METADATA"
+    lines = metadata.read_text().splitlines()
+    lines = [
+        f"License: {license}" if line.startswith("License:") else line for line in lines
+    ]
+    metadata.write_text("\n".join(lines) + "\n")
+
+
+def test_cache_is_invalidated_by_mtime_and_python_version(site: Path) -> None:
+    dist_info = install(site, "a", "MIT")
+    assert run()._packages["a"].license == "MIT"
+
+    # the cached license is reused while the dist-info directory is unchanged
+    set_license(dist_info, "GPL")
+    assert run()._packages["a"].license == "MIT"
+    assert run(use_cache=False)._packages["a"].license == "GPL"
+
+    # reinstalling the package changes the directory's mtime
+    mtime = dist_info.stat().st_mtime + 10
+    os.utime(dist_info, (mtime, mtime))
+    assert run()._packages["a"].license == "GPL"
+
+    # entries cached by another python version are not reused
+    set_license(dist_info, "BSD")
+    cache_file = ProjectLicense._cache_file()
+    cache = json.loads(cache_file.read_text())
+    cache["packages"][str(dist_info)]["python"] = [2, 7, 18]
+    cache_file.write_text(json.dumps(cache))
+    assert run()._packages["a"].license == "BSD"
+
+
+def test_cache_drops_uninstalled_packages(site: Path) -> None:
+    install(site, "a", "MIT")
+    b = install(site, "b", "MIT")
+    run()
+
+    cache_file = ProjectLicense._cache_file()
+    assert len(json.loads(cache_file.read_text())["packages"]) == 2
+
+    shutil.rmtree(b)
+    run()
+
+    packages = json.loads(cache_file.read_text())["packages"]
+    assert list(packages) == [str(site / "a-1.0.dist-info")]
+    # the cache is written through a temporary file that is renamed over it
+    assert list(cache_file.parent.iterdir()) == [cache_file]
+
+
+def test_cache_hits_do_not_parse_metadata(site: Path) -> None:
+    dist_info = install(site, "Foo_Bar", "MIT")
+    run()
+
+    # emptied in place so the dist-info directory's mtime and the cached entry stay valid
+    (dist_info / "METADATA").write_text("")
+    project = run()
+
+    assert list(project._packages) == ["Foo_Bar"]
+    assert project._packages["Foo_Bar"].license == "MIT"
+
+
+@pytest.mark.parametrize("entry", [None, [], {}, {"license": "GPL"}])
+def test_malformed_cache_is_ignored(site: Path, entry: Any) -> None:
+    dist_info = install(site, "a", "MIT")
+    if isinstance(entry, dict):
+        # otherwise valid entry that is missing some fields
+        entry["mtime"] = dist_info.stat().st_mtime
+        entry["python"] = list(sys.version_info[:3])
+    packages = [] if entry is None else {str(dist_info): entry}
+
+    cache_file = ProjectLicense._cache_file()
+    cache_file.parent.mkdir(parents=True)
+    cache = {"version": ProjectLicense._CACHE_VERSION, "packages": packages}
+    cache_file.write_text(json.dumps(cache))
+
+    assert run()._packages["a"].license == "MIT"